@@ -2,30 +2,140 @@
 Career GPS™ — AI Career Readiness Mentor
 Rewritten Streamlit experience aligned with product narrative
 """
-import json
+import copy
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
 
-from services.career_matcher import CareerMatcher
-from services.daily_learning import DailyLearningPlan
-from services.email_service import EmailService
-from services.email_templates import EmailTemplateGenerator
-from services.job_search import JobSearchService
-from services.readiness_score import ReadinessScoreCalculator
-from services.simulator import CareerSimulator
-from services.skill_extractor import SkillExtractor
-from services.skill_gap import SkillGapAnalyzer
-from services.user_auth import UserAuth
 from utils.helpers import (
+    build_resource_index,
     create_weekly_plan,
     format_timeline_estimate,
     get_risk_color,
-    get_skill_resources,
+    get_data_version,
     load_data,
 )
 
+PAGES = (
+    "Overview",
+    "Profile",
+    "Career Mentor",
+    "Readiness & Gaps",
+    "What-If Simulator",
+    "Roadmap",
+    "Daily Plan",
+    "Jobs & Outreach",
+    "Settings",
+)
+PAGE_INDEX = {page: idx for idx, page in enumerate(PAGES)}
+MATCH_TABLE_COLUMNS = [
+    "role_name",
+    "category",
+    "match_score",
+    "skill_overlap_score",
+    "missing_skills",
+    "growth_rate",
+    "description",
+]
+PROFILE_FORM_KEYS = (
+    "profile_name",
+    "profile_education",
+    "profile_experience",
+    "profile_major",
+    "profile_goal",
+    "profile_interests",
+    "profile_skills",
+)
+CERTIFICATION_PATTERN = re.compile(r"AWS|Azure|GCP|Certified|Certificate")
+STATIC_CHART_CONFIG = {"staticPlot": True, "displayModeBar": False, "responsive": False}
+JOBS_PAGE_SIZE = 5
+SESSION_DEFAULTS = {
+    "page": "auth",
+    "logged_in": False,
+    "user_email": None,
+    "user_data": None,
+    "user_profile": None,
+    "career_matches": None,
+    "career_matches_df": None,
+    "selected_career": None,
+    "baseline": None,
+    "simulations": [],
+    "daily_plan": None,
+    "job_results": None,
+    "jobs_shown": JOBS_PAGE_SIZE,
+    "learning_progress": {},
+    "selected_job_for_email": None,
+    "flash_message": None,
+    "pending_writes": [],
+}
+
+JOURNEY_STEPS = (
+    ("1️⃣", "Profile", "Share your skills & interests"),
+    ("2️⃣", "Match", "Discover aligned career paths"),
+    ("3️⃣", "Analyze", "View skill gaps & readiness"),
+    ("4️⃣", "Simulate", "Test career decisions"),
+    ("5️⃣", "Plan", "Generate learning roadmap"),
+    ("6️⃣", "Execute", "Daily tasks & job search"),
+)
+JOURNEY_STEPS_HTML = (
+    "<div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(120px, 1fr)); gap: 1rem;'>"
+    + "".join(
+        "<div style='text-align: center; padding: 1rem; background: rgba(6, 182, 212, 0.1); border-radius: 12px; border: 1px solid rgba(6, 182, 212, 0.2);'>"
+        f"<div style='font-size: 1.8rem; margin-bottom: 0.5rem;'>{emoji}</div>"
+        f"<div style='font-weight: 700; margin-bottom: 0.25rem;'>{title}</div>"
+        f"<div style='font-size: 0.8rem; color: #94a3b8;'>{desc}</div>"
+        "</div>"
+        for emoji, title, desc in JOURNEY_STEPS
+    )
+    + "</div>"
+)
+
+WHY_CAREER_GPS_POINTS = (
+    (
+        "Lack of personalized mentorship and unclear skill expectations",
+        "Static advice that ignores progress, pauses, or pivots",
+        "Academic learning that trails industry requirements",
+        "No preview of “If I do X, how close am I to job-ready?”",
+    ),
+    (
+        "AI mentor that scores readiness 0–100 in real time",
+        "Skill-gap navigator that pinpoints missing, partial, and known skills",
+        "What-if simulation engine for switching domains, pausing, or project-first paths",
+        "Adaptive roadmap with learning time and risk estimates",
+    ),
+)
+WHY_CAREER_GPS_HTML = (
+    "<div style='display: grid; grid-template-columns: repeat(auto-fit, minmax(280px, 1fr)); gap: 1rem;'>"
+    + "".join(
+        "<ul>" + "".join(f"<li>{point}</li>" for point in points) + "</ul>"
+        for points in WHY_CAREER_GPS_POINTS
+    )
+    + "</div>"
+)
+
+SIDEBAR_BRAND_HTML = """
+<div style='margin-bottom: 1.5rem;'>
+    <div style='font-size: 1.4rem; font-weight: 900; background: linear-gradient(135deg, #0ea5e9 0%, #06b6d4 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; background-clip: text;'>🧭 Career GPS</div>
+    <div style='font-size: 0.9rem; color: #cbd5e1; margin-top: 0.5rem;'>AI mentor for your career journey</div>
+</div>
+"""
+SIDEBAR_USER_TEMPLATE = """
+<div style='background: rgba(6, 182, 212, 0.1); border: 1px solid rgba(6, 182, 212, 0.2); border-radius: 8px; padding: 1rem; margin-bottom: 1rem;'>
+    <div style='font-weight: 700; color: #f1f5f9;'>{name}</div>
+    <div style='font-size: 0.85rem; color: #94a3b8;'>{user_type}</div>
+</div>
+"""
+SIDEBAR_PAGES_HEADING_HTML = "<div style='font-weight: 700; margin-bottom: 1rem; color: #cbd5e1;'>Pages</div>"
+SIDEBAR_STATUS_TEMPLATE = """
+<div style='background: rgba({rgb}, 0.1); border-left: 3px solid {color}; padding: 0.75rem; border-radius: 4px; margin-bottom: 0.75rem;'>
+    <div style='font-size: 0.8rem; font-weight: 600; color: {color};'>{title}</div>
+    <div style='font-size: 0.75rem; color: #cbd5e1;'>{detail}</div>
+</div>
+"""
+
 st.set_page_config(
     page_title="Career GPS — AI Career Mentor",
     page_icon="🎯",
@@ -33,13 +143,9 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-st.markdown(
-    """
-    <style>
+APP_CSS = """
     * {margin: 0; padding: 0;}
     body {
-        background: linear-gradient(135deg, #0f172a 0%, #1e293b 100%);
-        color: #e2e8f0;
         font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
     }
     .stApp {background: linear-gradient(135deg, #0f172a 0%, #1e293b 100%);}
@@ -126,6 +232,12 @@ st.markdown(
     .metric-hint {color: #64748b; font-size: 0.85rem; margin-top: -0.4rem; font-weight: 500;}
     
     /* Metrics */
+    .metric-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
     .metric-card {
         background: linear-gradient(135deg, rgba(30, 41, 59, 0.6) 0%, rgba(15, 23, 42, 0.8) 100%);
         border: 1px solid rgba(6, 182, 212, 0.2);
@@ -153,6 +265,19 @@ st.markdown(
         font-weight: 600;
     }
     
+    /* Skill breakdown chips */
+    .skill-chip {
+        display: block;
+        padding: 0.5rem 0.75rem;
+        border-radius: 8px;
+        margin-bottom: 0.5rem;
+        font-size: 0.9rem;
+        font-weight: 500;
+    }
+    .skill-chip.known {background: rgba(16, 185, 129, 0.15); color: #6ee7b7;}
+    .skill-chip.partial {background: rgba(245, 158, 11, 0.15); color: #fcd34d;}
+    .skill-chip.missing {background: rgba(239, 68, 68, 0.15); color: #fca5a5;}
+    
     /* Button overrides */
     .stButton > button {
         background: linear-gradient(135deg, #0ea5e9 0%, #06b6d4 100%);
@@ -175,18 +300,6 @@ st.markdown(
         border-right: 1px solid rgba(6, 182, 212, 0.15);
     }
     
-    /* Expanders */
-    .streamlit-expanderHeader {
-        background: linear-gradient(135deg, rgba(30, 41, 59, 0.5) 0%, rgba(15, 23, 42, 0.7) 100%);
-        border: 1px solid rgba(6, 182, 212, 0.15);
-        border-radius: 8px;
-        transition: all 0.3s ease;
-    }
-    .streamlit-expanderHeader:hover {
-        background: linear-gradient(135deg, rgba(30, 41, 59, 0.7) 0%, rgba(15, 23, 42, 0.9) 100%);
-        border-color: rgba(6, 182, 212, 0.3);
-    }
-    
     /* Tabs */
     .stTabs [data-baseweb="tab-list"] {
         gap: 8px;
@@ -205,8 +318,7 @@ st.markdown(
     
     /* Input fields */
     .stTextInput > div > div > input,
-    .stTextArea > div > div > textarea,
-    .stSelectbox > div > div > select {
+    .stTextArea > div > div > textarea {
         background: rgba(15, 23, 42, 0.6) !important;
         border: 1px solid rgba(6, 182, 212, 0.2) !important;
         color: #e2e8f0 !important;
@@ -214,8 +326,7 @@ st.markdown(
         padding: 0.75rem 1rem !important;
     }
     .stTextInput > div > div > input:focus,
-    .stTextArea > div > div > textarea:focus,
-    .stSelectbox > div > div > select:focus {
+    .stTextArea > div > div > textarea:focus {
         border-color: rgba(6, 182, 212, 0.6) !important;
         box-shadow: 0 0 0 3px rgba(6, 182, 212, 0.1) !important;
     }
@@ -227,10 +338,6 @@ st.markdown(
         border-radius: 8px;
         padding: 1rem 1.25rem;
     }
-    .stSuccess {border-left-color: #10b981 !important;}
-    .stError {border-left-color: #ef4444 !important;}
-    .stWarning {border-left-color: #f59e0b !important;}
-    .stInfo {border-left-color: #06b6d4 !important;}
     
     /* Divider */
     .stMarkdown hr {
@@ -245,52 +352,274 @@ st.markdown(
         color: #94a3b8;
         font-size: 0.85rem;
     }
-    </style>
-    """,
-    unsafe_allow_html=True,
-)
+"""
 
 
-@st.cache_data
-def load_app_data():
+@st.cache_resource
+def get_app_style():
+    # Comments and indentation are stripped once per process, not per rerun
+    css = re.sub(r"/\*.*?\*/", "", APP_CSS, flags=re.S)
+    css = re.sub(r"\s*([{}:;,>])\s*", r"\1", css)
+    return "<style>" + re.sub(r"\s+", " ", css).strip() + "</style>"
+
+
+# st.html skips the markdown parser, and a style-only payload takes no layout space
+st.html(get_app_style())
+
+
+# The datasets are only read downstream, so every session shares the same
+# frames instead of receiving a fresh copy on each rerun.
+@st.cache_resource(show_spinner=False)
+def load_app_data(data_version):
     return load_data()
 
 
+# Services are built on first use by the page that needs them, so the auth
+# screen only pays for UserAuth; each service module is imported lazily too.
+# DataFrame args are keyed by data_version, so no rerun hashes their rows.
+@st.cache_resource
+def get_skill_extractor(data_version, _skills_df):
+    from services.skill_extractor import SkillExtractor
+
+    return SkillExtractor(_skills_df)
+
+
+@st.cache_resource
+def get_career_matcher(data_version, _careers_df):
+    from services.career_matcher import CareerMatcher
+
+    return CareerMatcher(_careers_df)
+
+
+@st.cache_resource
+def get_skill_gap_analyzer(data_version, _skills_df):
+    from services.skill_gap import SkillGapAnalyzer
+
+    return SkillGapAnalyzer(_skills_df)
+
+
+@st.cache_resource
+def get_readiness_calculator():
+    from services.readiness_score import ReadinessScoreCalculator
+
+    return ReadinessScoreCalculator()
+
+
+@st.cache_resource
+def get_simulator(data_version, _skills_df):
+    from services.simulator import CareerSimulator
+
+    return CareerSimulator(_skills_df)
+
+
+@st.cache_resource
+def get_user_auth():
+    from services.user_auth import UserAuth
+
+    return UserAuth()
+
+
+# users.json writes run off the script thread. A single worker keeps them in
+# submission order, and UserAuth locks around each load-modify-save.
+@st.cache_resource
+def get_writer_pool():
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="users-writer")
+
+
+def _log_write_failure(future):
+    if future.exception() is not None:
+        logging.getLogger(__name__).error("users.json write failed", exc_info=future.exception())
+
+
+def submit_user_write(method, *args):
+    future = get_writer_pool().submit(method, *args)
+    future.add_done_callback(_log_write_failure)
+    # Kept so the next run can tell the user if the write did not land
+    st.session_state.pending_writes.append(future)
+
+
+def wait_for_user_writes():
+    # The worker runs jobs in order, so a no-op queued now only finishes once
+    # every write submitted before it has been saved
+    get_writer_pool().submit(int).result()
+
+
+def report_user_write_failures():
+    pending = st.session_state.pending_writes
+    st.session_state.pending_writes = [future for future in pending if not future.done()]
+    for future in pending:
+        if not future.done():
+            continue
+        if future.exception() is not None:
+            st.error(f"⚠️ Your changes could not be saved: {future.exception()}")
+        else:
+            success, message = future.result()
+            if not success:
+                st.error(f"⚠️ Your changes could not be saved: {message}")
+
+
+@st.cache_resource
+def get_email_service():
+    from services.email_service import EmailService
+
+    return EmailService()
+
+
 @st.cache_resource
-def init_services(careers_df, skills_df):
-    return (
-        SkillExtractor(skills_df),
-        CareerMatcher(careers_df),
-        SkillGapAnalyzer(skills_df),
-        ReadinessScoreCalculator(),
-        CareerSimulator(skills_df),
-        UserAuth(),
-        EmailService(),
-        JobSearchService(careers_df),
-        EmailTemplateGenerator(),
-        DailyLearningPlan(),
+def get_job_search(data_version, _careers_df):
+    from services.job_search import JobSearchService
+
+    return JobSearchService(_careers_df)
+
+
+@st.cache_resource
+def get_email_templates():
+    from services.email_templates import EmailTemplateGenerator
+
+    return EmailTemplateGenerator()
+
+
+@st.cache_resource
+def get_daily_learning():
+    from services.daily_learning import DailyLearningPlan
+
+    return DailyLearningPlan()
+
+
+@st.cache_data(show_spinner=False)
+def build_readiness_chart(breakdown_items):
+    import plotly.graph_objects as go
+
+    labels = [label for label, _ in breakdown_items]
+    values = [value for _, value in breakdown_items]
+    fig = go.Figure(
+        go.Bar(
+            x=values,
+            y=labels,
+            orientation="h",
+            marker=dict(color=values, colorscale="Blues"),
+            text=[f"{v:.1f}%" for v in values],
+            textposition="auto",
+        )
     )
+    fig.update_layout(height=280, showlegend=False, margin=dict(l=0, r=0, t=8, b=8), uirevision="readiness")
+    # A plain dict unpickles from the cache without rebuilding Figure objects
+    return fig.to_dict()
+
+
+# The simulation comparison is keyed by its small column dict rather than by
+# hashing a DataFrame built from it.
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_comparison_table(comparison):
+    import pyarrow as pa
+
+    return pa.Table.from_pydict(comparison)
+
+
+# Service results are pure functions of their inputs, so they are cached per raw
+# skills text or sorted skills tuple and data_version; leading-underscore args
+# are excluded from the cache key.
+@st.cache_data(max_entries=32, show_spinner=False)
+def cached_skill_extraction(_skill_extractor, data_version, text):
+    if "," in text:
+        return _skill_extractor.extract_from_list(text)
+    return _skill_extractor.extract_from_text(text)
+
+
+# Matching embeds the joined skills with word bigrams, so skill order changes the
+# scores; the key keeps the profile's order instead of sorting it.
+@st.cache_data(max_entries=64, show_spinner=False)
+def cached_career_matches(_career_matcher, data_version, skills, interests, top_n=5):
+    return _career_matcher.match_careers(list(skills), interests, top_n=top_n)
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def cached_gap_analysis(_skill_gap_analyzer, data_version, skills_key, role_id, _career):
+    return _skill_gap_analyzer.analyze_gap(list(skills_key), _career)
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def cached_readiness_score(_readiness_calculator, data_version, skills_key, role_id, _gap):
+    return _readiness_calculator.calculate_score(_gap)
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def cached_baseline(_simulator, data_version, skills_key, role_id, _career, _gap, _score):
+    return _simulator.create_baseline(list(skills_key), _career, _gap, _score)
+
+
+# Resources grouped by skill once per data version, so lookups are dict hits
+# instead of a resources_df scan per skill.
+@st.cache_resource(show_spinner=False)
+def get_resource_index(data_version, _resources_df):
+    return build_resource_index(_resources_df)
+
+
+# The roadmap body only depends on the gap's skill lists, so the plan and its
+# per-phase markdown are built once per gap instead of on every rerun.
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_roadmap_view(missing_skills, partial_skills, data_version, _skills_df, _resource_index):
+    plan = create_weekly_plan(list(missing_skills), list(partial_skills), _skills_df)
+    phases = []
+    for phase in plan:
+        blocks = []
+        for task in phase["skills"]:
+            blocks.append(f"**{task['type']}** {task['skill']} · {task['difficulty']}")
+            resources = _resource_index.get(task["skill"].lower(), [])
+            if resources:
+                blocks.append(":gray[Top resources:]")
+                blocks.append(
+                    "\n".join(f"- [{res['name']}]({res['url']}) · {res['type']} · {res['duration']} weeks" for res in resources[:2])
+                )
+        phases.append(
+            {
+                "title": f"Phase {phase['phase']} · {phase['duration_weeks']} weeks",
+                "expanded": phase["phase"] == 1,
+                "body_md": "\n\n".join(blocks),
+            }
+        )
+    return plan, phases
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_daily_skill_gaps(missing_skills, partial_skills, data_version, _resource_index):
+    return [
+        {"skill": skill, "priority": 100, "hours_needed": 20, "resources": _resource_index.get(skill.lower(), [])}
+        for skill in missing_skills
+    ] + [
+        {"skill": skill, "priority": 60, "hours_needed": 10, "resources": _resource_index.get(skill.lower(), [])}
+        for skill in partial_skills
+    ]
+
+
+# Not cached: hashing the nested payload for st.cache_data costs far more than
+# orjson takes to encode it.
+def encode_roadmap_json(roadmap):
+    import orjson
+
+    return orjson.dumps(roadmap, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
 
 
 def ensure_session_defaults():
-    defaults = {
-        "page": "auth",
-        "logged_in": False,
-        "user_email": None,
-        "user_data": None,
-        "user_profile": None,
-        "career_matches": None,
-        "selected_career": None,
-        "baseline": None,
-        "simulations": [],
-        "daily_plan": None,
-        "job_results": None,
-        "learning_progress": {},
-        "selected_job_for_email": None,
-    }
-    for key, value in defaults.items():
+    for key, value in SESSION_DEFAULTS.items():
         if key not in st.session_state:
-            st.session_state[key] = value
+            # Copied so the list/dict defaults are never shared between sessions
+            st.session_state[key] = copy.copy(value)
+
+
+# Navigation runs in on_click callbacks, so the rerun triggered by the click
+# already renders the target page instead of paying for a second st.rerun().
+def go_to_page(page):
+    st.session_state.page = page
+
+
+def logout():
+    wait_for_user_writes()
+    st.session_state.logged_in = False
+    st.session_state.page = "Overview"
+    st.session_state.user_email = None
+    st.session_state.user_data = None
+    st.session_state.user_profile = None
 
 
 def render_auth():
@@ -319,10 +648,13 @@ def render_auth():
 
         with tab_login:
             st.markdown("#### Welcome back!")
-            email = st.text_input("Email", key="login_email", placeholder="your@email.com")
-            password = st.text_input("Password", type="password", key="login_pwd", placeholder="Enter password")
-            if st.button("Login", type="primary", use_container_width=True):
-                success, user_data, message = user_auth.login_user(email, password)
+            with st.form("login_form"):
+                email = st.text_input("Email", key="login_email", placeholder="your@email.com")
+                password = st.text_input("Password", type="password", key="login_pwd", placeholder="Enter password")
+                submitted = st.form_submit_button("Login", type="primary", use_container_width=True)
+            if submitted:
+                wait_for_user_writes()
+                success, user_data, message = get_user_auth().login_user(email, password)
                 if success:
                     st.session_state.logged_in = True
                     st.session_state.user_email = email
@@ -334,20 +666,22 @@ def render_auth():
                         st.session_state.learning_progress = {
                             k: v.get("progress", 0) for k, v in user_data["learning_progress"].items()
                         }
-                    st.success("Welcome back! Redirecting...")
+                    st.session_state.flash_message = "Welcome back!"
                     st.rerun()
                 else:
                     st.error(message)
 
         with tab_signup:
             st.markdown("#### Create your career profile")
-            name = st.text_input("Full Name", key="signup_name", placeholder="John Doe")
-            email = st.text_input("Email", key="signup_email", placeholder="your@email.com")
-            password = st.text_input("Password", type="password", key="signup_pwd", placeholder="Min 6 characters")
-            confirm = st.text_input("Confirm Password", type="password", key="signup_confirm", placeholder="Repeat password")
-            user_type = st.selectbox("I am a", ["student", "fresh graduate", "professional"], index=0)
-
-            if st.button("Create Account", type="primary", use_container_width=True):
+            with st.form("signup_form"):
+                name = st.text_input("Full Name", key="signup_name", placeholder="John Doe")
+                email = st.text_input("Email", key="signup_email", placeholder="your@email.com")
+                password = st.text_input("Password", type="password", key="signup_pwd", placeholder="Min 6 characters")
+                confirm = st.text_input("Confirm Password", type="password", key="signup_confirm", placeholder="Repeat password")
+                user_type = st.selectbox("I am a", ["student", "fresh graduate", "professional"], index=0)
+                submitted = st.form_submit_button("Create Account", type="primary", use_container_width=True)
+
+            if submitted:
                 if not all([name, email, password, confirm]):
                     st.error("Please fill in all fields.")
                 elif password != confirm:
@@ -355,7 +689,7 @@ def render_auth():
                 elif len(password) < 6:
                     st.error("Use at least 6 characters.")
                 else:
-                    success, message = user_auth.register_user(email, password, name, user_type)
+                    success, message = get_user_auth().register_user(email, password, name, user_type)
                     if success:
                         st.success("Account created. Please log in.")
                     else:
@@ -365,96 +699,63 @@ def render_auth():
 
 
 def sidebar_nav():
-    st.sidebar.markdown(
-        """
-        <div style='margin-bottom: 1.5rem;'>
-            <div style='font-size: 1.4rem; font-weight: 900; background: linear-gradient(135deg, #0ea5e9 0%, #06b6d4 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent; background-clip: text;'>🧭 Career GPS</div>
-            <div style='font-size: 0.9rem; color: #cbd5e1; margin-top: 0.5rem;'>AI mentor for your career journey</div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
-    st.sidebar.markdown("---")
-
-    if st.sidebar.button("🚪 Logout", use_container_width=True):
-        st.session_state.logged_in = False
-        st.session_state.page = "Overview"
-        st.session_state.user_email = None
-        st.session_state.user_data = None
-        st.session_state.user_profile = None
-        st.rerun()
+    # Static HTML between widgets goes out as one markdown element per gap
+    st.sidebar.markdown(SIDEBAR_BRAND_HTML + "<hr>", unsafe_allow_html=True)
 
-    if st.session_state.user_data:
-        st.sidebar.markdown(
-            f"""
-            <div style='background: rgba(6, 182, 212, 0.1); border: 1px solid rgba(6, 182, 212, 0.2); border-radius: 8px; padding: 1rem; margin-bottom: 1rem;'>
-                <div style='font-weight: 700; color: #f1f5f9;'>{st.session_state.user_data.get('name', 'User')}</div>
-                <div style='font-size: 0.85rem; color: #94a3b8;'>{st.session_state.user_data.get('user_type', 'student').title()}</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
-        )
-        st.sidebar.markdown("---")
+    st.sidebar.button("🚪 Logout", use_container_width=True, on_click=logout)
 
-    st.sidebar.markdown("<div style='font-weight: 700; margin-bottom: 1rem; color: #cbd5e1;'>Pages</div>", unsafe_allow_html=True)
-    
-    pages = [
-        "Overview",
-        "Profile",
-        "Career Mentor",
-        "Readiness & Gaps",
-        "What-If Simulator",
-        "Roadmap",
-        "Daily Plan",
-        "Jobs & Outreach",
-        "Settings",
-    ]
+    header = ""
+    if st.session_state.user_data:
+        header = SIDEBAR_USER_TEMPLATE.format(
+            name=st.session_state.user_data.get("name", "User"),
+            user_type=st.session_state.user_data.get("user_type", "student").title(),
+        ) + "<hr>"
+    st.sidebar.markdown(header + SIDEBAR_PAGES_HEADING_HTML, unsafe_allow_html=True)
     
     # Sync with session state page
     current_page = st.session_state.get("page", "Overview")
-    default_index = pages.index(current_page) if current_page in pages else 0
+    default_index = PAGE_INDEX.get(current_page, 0)
     
-    nav = st.sidebar.radio(
+    nav = st.sidebar.selectbox(
         "Navigate",
-        pages,
+        PAGES,
         index=default_index,
         label_visibility="collapsed",
     )
     
     # Update session state with sidebar selection
-    st.session_state.page = nav
+    if current_page != nav:
+        st.session_state.page = nav
 
-    st.sidebar.markdown("---")
+    status_cards = ["<hr>"]
     if st.session_state.user_profile:
-        st.sidebar.markdown(
-            f"""
-            <div style='background: rgba(16, 185, 129, 0.1); border-left: 3px solid #10b981; padding: 0.75rem; border-radius: 4px; margin-bottom: 0.75rem;'>
-                <div style='font-size: 0.8rem; font-weight: 600; color: #10b981;'>✓ Profile Ready</div>
-                <div style='font-size: 0.75rem; color: #94a3b8;'>{len(st.session_state.user_profile.get('skills', []))} skills</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
+        status_cards.append(
+            SIDEBAR_STATUS_TEMPLATE.format(
+                rgb="16, 185, 129",
+                color="#10b981",
+                title="✓ Profile Ready",
+                detail=f"{len(st.session_state.user_profile.get('skills', []))} skills",
+            )
         )
     if st.session_state.selected_career:
-        st.sidebar.markdown(
-            f"""
-            <div style='background: rgba(6, 182, 212, 0.1); border-left: 3px solid #06b6d4; padding: 0.75rem; border-radius: 4px; margin-bottom: 0.75rem;'>
-                <div style='font-size: 0.8rem; font-weight: 600; color: #06b6d4;'>🎯 Target</div>
-                <div style='font-size: 0.75rem; color: #cbd5e1;'>{st.session_state.selected_career['role_name']}</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
+        status_cards.append(
+            SIDEBAR_STATUS_TEMPLATE.format(
+                rgb="6, 182, 212",
+                color="#06b6d4",
+                title="🎯 Target",
+                detail=st.session_state.selected_career["role_name"],
+            )
         )
     if st.session_state.baseline:
-        st.sidebar.markdown(
-            f"""
-            <div style='background: rgba(249, 115, 22, 0.1); border-left: 3px solid #f97316; padding: 0.75rem; border-radius: 4px;'>
-                <div style='font-size: 0.8rem; font-weight: 600; color: #f97316;'>📊 Readiness</div>
-                <div style='font-size: 0.75rem; color: #cbd5e1;'>{st.session_state.baseline['readiness_score']['overall_score']} | {st.session_state.baseline['risk_level']} risk</div>
-            </div>
-            """,
-            unsafe_allow_html=True,
+        status_cards.append(
+            SIDEBAR_STATUS_TEMPLATE.format(
+                rgb="249, 115, 22",
+                color="#f97316",
+                title="📊 Readiness",
+                detail=f"{st.session_state.baseline['readiness_score']['overall_score']} | {st.session_state.baseline['risk_level']} risk",
+            )
         )
+    st.sidebar.markdown("".join(status_cards), unsafe_allow_html=True)
 
     return nav
 
@@ -475,73 +776,39 @@ def render_overview(careers_df, skills_df, resources_df):
 
     st.markdown("---")
     st.subheader("Why Career GPS")
-    col1, col2 = st.columns(2)
-    with col1:
-        st.write(
-            """
-            - Lack of personalized mentorship and unclear skill expectations
-            - Static advice that ignores progress, pauses, or pivots
-            - Academic learning that trails industry requirements
-            - No preview of “If I do X, how close am I to job-ready?”
-            """
-        )
-    with col2:
-        st.write(
-            """
-            - AI mentor that scores readiness 0–100 in real time
-            - Skill-gap navigator that pinpoints missing, partial, and known skills
-            - What-if simulation engine for switching domains, pausing, or project-first paths
-            - Adaptive roadmap with learning time and risk estimates
-            """
-        )
+    st.markdown(WHY_CAREER_GPS_HTML, unsafe_allow_html=True)
 
     st.markdown("---")
 
     # The flow
     st.markdown("<div class='section-title'>Your Career Journey</div>", unsafe_allow_html=True)
     
-    steps_col = st.columns(6)
-    steps = [
-        ("1️⃣", "Profile", "Share your skills & interests"),
-        ("2️⃣", "Match", "Discover aligned career paths"),
-        ("3️⃣", "Analyze", "View skill gaps & readiness"),
-        ("4️⃣", "Simulate", "Test career decisions"),
-        ("5️⃣", "Plan", "Generate learning roadmap"),
-        ("6️⃣", "Execute", "Daily tasks & job search"),
-    ]
-    
-    for idx, (emoji, title, desc) in enumerate(steps):
-        with steps_col[idx]:
-            st.markdown(
-                f"""
-                <div style='text-align: center; padding: 1rem; background: rgba(6, 182, 212, 0.1); border-radius: 12px; border: 1px solid rgba(6, 182, 212, 0.2);'>
-                <div style='font-size: 1.8rem; margin-bottom: 0.5rem;'>{emoji}</div>
-                <div style='font-weight: 700; margin-bottom: 0.25rem;'>{title}</div>
-                <div style='font-size: 0.8rem; color: #94a3b8;'>{desc}</div>
-                </div>
-                """,
-                unsafe_allow_html=True,
-            )
+    st.markdown(JOURNEY_STEPS_HTML, unsafe_allow_html=True)
 
     st.markdown("---")
 
     col1, col2 = st.columns([1, 1])
     with col1:
-        if st.button("🚀 Start Your Profile", type="primary", use_container_width=True, key="overview_profile_btn"):
-            st.session_state.page = "Profile"
-            st.rerun()
+        st.button(
+            "🚀 Start Your Profile",
+            type="primary",
+            use_container_width=True,
+            key="overview_profile_btn",
+            on_click=go_to_page,
+            args=("Profile",),
+        )
     with col2:
         st.info("💡 Complete your profile first to unlock career recommendations.")
 
 
-def render_profile(skill_extractor):
+def render_profile(skill_extractor, data_version):
     st.markdown("<div class='section-title'>Your Career Profile</div>", unsafe_allow_html=True)
     st.markdown("<div class='muted'>Tell us about yourself so we can find the perfect career path for you.</div>", unsafe_allow_html=True)
     
     with st.form("profile_form"):
         col1, col2 = st.columns(2)
         with col1:
-            name = st.text_input("📝 Full Name", value=st.session_state.user_profile.get("name", "") if st.session_state.user_profile else "", placeholder="John Doe")
+            name = st.text_input("📝 Full Name", value=st.session_state.user_profile.get("name", "") if st.session_state.user_profile else "", placeholder="John Doe", key="profile_name")
             education = st.selectbox(
                 "🎓 Education Level",
                 [
@@ -553,15 +820,17 @@ def render_profile(skill_extractor):
                     "Bootcamp Graduate",
                     "Self-Taught",
                 ],
+                key="profile_education",
             )
             experience = st.selectbox(
                 "💼 Experience",
                 ["Student", "Fresh Graduate", "0-2 Years", "2-5 Years", "5+ Years"],
+                key="profile_experience",
             )
         with col2:
-            major = st.text_input("🔬 Major/Field", value="", placeholder="Computer Science, Marketing, etc.")
-            goal = st.text_input("🎯 Career Goal", value="", placeholder="Software Engineer, Product Manager, etc.")
-            interests = st.text_area("💡 Interests & Passions", value="", height=80, placeholder="What excites you? (AI, startups, design, etc.)")
+            major = st.text_input("🔬 Major/Field", value="", placeholder="Computer Science, Marketing, etc.", key="profile_major")
+            goal = st.text_input("🎯 Career Goal", value="", placeholder="Software Engineer, Product Manager, etc.", key="profile_goal")
+            interests = st.text_area("💡 Interests & Passions", value="", height=80, placeholder="What excites you? (AI, startups, design, etc.)", key="profile_interests")
 
         st.markdown("---")
         skills_input = st.text_area(
@@ -570,20 +839,21 @@ def render_profile(skill_extractor):
             height=120,
             placeholder="Python, JavaScript, React, AWS, Project Management...\n\nOr describe your background in free text.",
             help="Include programming languages, tools, technologies, certifications, and soft skills",
+            key="profile_skills",
         )
         
         col1, col2 = st.columns([1, 1])
         with col1:
             submitted = st.form_submit_button("Save Profile", type="primary", use_container_width=True)
         with col2:
-            st.form_submit_button("Clear", use_container_width=True)
+            st.form_submit_button("Clear", use_container_width=True, on_click=clear_profile_form)
 
         if submitted:
             if not skills_input:
                 st.error("Please add at least a few skills or experience to get started.")
             else:
                 with st.spinner("🔍 Extracting and analyzing your skills..."):
-                    extracted = skill_extractor.extract_from_list(skills_input) if "," in skills_input else skill_extractor.extract_from_text(skills_input)
+                    extracted = cached_skill_extraction(skill_extractor, data_version, skills_input)
                 if not extracted:
                     st.error("No skills detected. Try using comma-separated keywords or describe your experience in more detail.")
                 else:
@@ -602,7 +872,7 @@ def render_profile(skill_extractor):
                     st.session_state.selected_career = None
                     st.session_state.baseline = None
                     st.session_state.simulations = []
-                    user_auth.update_user_profile(st.session_state.user_email, profile)
+                    submit_user_write(get_user_auth().update_user_profile, st.session_state.user_email, profile)
                     st.success(f"✅ Profile saved with {len(extracted)} skills!")
                     st.info("Go to **Career Mentor** from the sidebar to see your matches.")
 
@@ -622,80 +892,101 @@ def render_profile(skill_extractor):
         
         col1, col2 = st.columns([1, 1])
         with col1:
-            if st.button("➡️ Next: Career Mentor", type="primary", use_container_width=True, key="profile_to_mentor"):
-                st.session_state.page = "Career Mentor"
-                st.rerun()
+            st.button(
+                "➡️ Next: Career Mentor",
+                type="primary",
+                use_container_width=True,
+                key="profile_to_mentor",
+                on_click=go_to_page,
+                args=("Career Mentor",),
+            )
         with col2:
             if st.button("🔄 Update Profile", use_container_width=True, key="profile_refresh"):
                 st.session_state.user_profile = None
                 st.rerun()
 
 
-def render_career_mentor(career_matcher):
+def clear_profile_form():
+    # Dropping the widget state resets every field to its default on this rerun
+    for key in PROFILE_FORM_KEYS:
+        if key in st.session_state:
+            del st.session_state[key]
+
+
+def render_career_mentor(career_matcher, data_version):
     if not st.session_state.user_profile:
         st.warning("⚠️ Please create your profile first.")
-        if st.button("Go to Profile", type="primary", use_container_width=True):
-            st.session_state.page = "Profile"
-            st.rerun()
+        st.button("Go to Profile", type="primary", use_container_width=True, on_click=go_to_page, args=("Profile",))
         return
 
     profile = st.session_state.user_profile
     if st.session_state.career_matches is None:
         with st.spinner("🔍 Finding perfect career matches for you..."):
-            st.session_state.career_matches = career_matcher.match_careers(
-                profile["skills"], profile.get("interests", ""), top_n=5
+            st.session_state.career_matches = cached_career_matches(
+                career_matcher, data_version, tuple(profile["skills"]), profile.get("interests", ""), top_n=5
             )
+            st.session_state.career_matches_df = build_match_table(st.session_state.career_matches)
 
-    matches = st.session_state.career_matches
     st.markdown("<div class='section-title'>Your Career Matches</div>", unsafe_allow_html=True)
-    st.markdown("<div class='muted'>AI found these roles that align with your skills. Select one to dive deeper.</div>", unsafe_allow_html=True)
+    st.markdown("<div class='muted'>AI found these roles that align with your skills. Select a row to analyze your readiness.</div>", unsafe_allow_html=True)
+
+    st.dataframe(
+        st.session_state.career_matches_df,
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "role_name": "Career",
+            "category": "Category",
+            "match_score": st.column_config.ProgressColumn("Match", format="%.1f%%", min_value=0, max_value=100),
+            "skill_overlap_score": st.column_config.ProgressColumn("Overlap", format="%.1f%%", min_value=0, max_value=100),
+            "missing_skills": st.column_config.NumberColumn("Missing", format="%d"),
+            "growth_rate": "Growth",
+            "description": "Description",
+        },
+        key="career_match_table",
+        on_select=select_career_match,
+        selection_mode="single-row",
+    )
 
-    for match in matches:
-        with st.container():
-            cols = st.columns([3, 1, 1, 1])
-            cols[0].markdown(f"**{match['role_name']}** · {match['category']}")
-            cols[0].write(match["description"])
-            cols[1].metric("Match", f"{match['match_score']:.1f}%")
-            cols[2].metric("Overlap", f"{match['skill_overlap_score']:.1f}%")
-            cols[3].metric("Missing", len(match["missing_skills"]))
-            if st.button(f"📊 Analyze Readiness", key=f"select_{match['role_id']}", type="primary", use_container_width=True):
-                st.session_state.selected_career = match
-                st.session_state.baseline = None
-                st.session_state.simulations = []
-                st.session_state.page = "Readiness & Gaps"
-                st.rerun()
 
-    st.markdown("---")
-    df = pd.DataFrame(
-        [
-            {
-                "Career": m["role_name"],
-                "Match": round(m["match_score"], 1),
-                "Overlap": round(m["skill_overlap_score"], 1),
-                "Missing": len(m["missing_skills"]),
-                "Growth": m["growth_rate"].replace("_", " ").title(),
-            }
-            for m in matches
-        ]
-    )
-    st.dataframe(df, use_container_width=True, hide_index=True)
+# Built once per match set and kept in session next to career_matches
+def build_match_table(matches):
+    # Parallel column lists skip pandas' per-record dict inference
+    columns = {col: [m[col] for m in matches] for col in MATCH_TABLE_COLUMNS}
+    columns["missing_skills"] = [len(skills) for skills in columns["missing_skills"]]
+    columns["growth_rate"] = [rate.replace("_", " ").title() for rate in columns["growth_rate"]]
+    return pd.DataFrame(columns)
+
+
+def select_career_match():
+    rows = st.session_state.career_match_table.selection.rows
+    if rows:
+        st.session_state.selected_career = st.session_state.career_matches[rows[0]]
+        st.session_state.baseline = None
+        st.session_state.simulations = []
+        st.session_state.page = "Readiness & Gaps"
 
 
-def render_readiness(skill_gap_analyzer, readiness_calculator, simulator):
+def render_readiness(skill_gap_analyzer, readiness_calculator, simulator, data_version):
     if not st.session_state.selected_career:
         st.warning("⚠️ Select a career from Career Mentor first.")
-        if st.button("Go to Career Mentor", type="primary", use_container_width=True):
-            st.session_state.page = "Career Mentor"
-            st.rerun()
+        st.button(
+            "Go to Career Mentor",
+            type="primary",
+            use_container_width=True,
+            on_click=go_to_page,
+            args=("Career Mentor",),
+        )
         return
 
     career = st.session_state.selected_career
     profile = st.session_state.user_profile
 
-    gap = skill_gap_analyzer.analyze_gap(profile["skills"], career)
-    score = readiness_calculator.calculate_score(gap)
-    if st.session_state.baseline is None or st.session_state.baseline.get("career") != career["role_name"]:
-        st.session_state.baseline = simulator.create_baseline(profile["skills"], career)
+    skills_key = tuple(sorted(profile["skills"]))
+    gap = cached_gap_analysis(skill_gap_analyzer, data_version, skills_key, career["role_id"], career)
+    score = cached_readiness_score(readiness_calculator, data_version, skills_key, career["role_id"], gap)
+    if st.session_state.baseline is None or st.session_state.baseline.get("role_id") != career["role_id"]:
+        st.session_state.baseline = cached_baseline(simulator, data_version, skills_key, career["role_id"], career, gap, score)
 
     baseline = st.session_state.baseline
 
@@ -706,59 +997,61 @@ def render_readiness(skill_gap_analyzer, readiness_calculator, simulator):
     cols[2].metric("Time to ready", format_timeline_estimate(gap["estimated_learning_time_weeks"]))
     cols[3].metric("Risk", baseline["risk_level"], label_visibility="visible")
 
-    fig = go.Figure(
-        go.Bar(
-            x=list(score["breakdown"].values()),
-            y=list(score["breakdown"].keys()),
-            orientation="h",
-            marker=dict(color=list(score["breakdown"].values()), colorscale="Blues"),
-            text=[f"{v:.1f}%" for v in score["breakdown"].values()],
-            textposition="auto",
-        )
-    )
-    fig.update_layout(height=280, showlegend=False)
-    st.plotly_chart(fig, use_container_width=True)
+    fig = build_readiness_chart(tuple(score["breakdown"].items()))
+    st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
     st.info(score["interpretation"])
 
     st.markdown("---")
     st.markdown("**Priority skills to learn first**")
     if gap["priority_skills"]:
-        cols = st.columns(min(len(gap["priority_skills"]), 4))
-        for idx, skill in enumerate(gap["priority_skills"]):
-            with cols[idx % len(cols)]:
-                st.write(f"{idx+1}. {skill}")
+        st.markdown(
+            "".join(f"<span class='pill'>{idx}. {skill}</span>" for idx, skill in enumerate(gap["priority_skills"], 1)),
+            unsafe_allow_html=True,
+        )
     else:
         st.success("No critical gaps detected.")
 
     st.markdown("**Skill breakdown**")
-    col1, col2, col3 = st.columns(3)
-    col1.write("Known")
-    for s in gap["matched_skills"][:8]:
-        col1.success(s)
-    col2.write("Partial")
-    for s in gap["partial_skills"][:8]:
-        col2.warning(s)
-    col3.write("Missing")
-    for s in gap["missing_skills"][:8]:
-        col3.error(s)
+    breakdown = (
+        ("Known", "known", gap["matched_skills"]),
+        ("Partial", "partial", gap["partial_skills"]),
+        ("Missing", "missing", gap["missing_skills"]),
+    )
+    for col, (title, kind, skills) in zip(st.columns(3), breakdown):
+        chips = "".join(f"<div class='skill-chip {kind}'>{s}</div>" for s in skills[:8])
+        col.markdown(f"<p>{title}</p>{chips}", unsafe_allow_html=True)
 
     st.markdown("---")
     c1, c2 = st.columns(2)
-    if c1.button("🎲 Simulate Career Decisions", type="primary", use_container_width=True, key="readiness_to_simulator"):
-        st.session_state.page = "What-If Simulator"
-        st.rerun()
-    if c2.button("🗺️ Generate Learning Roadmap", type="secondary", use_container_width=True, key="readiness_to_roadmap"):
-        st.session_state.page = "Roadmap"
-        st.rerun()
+    c1.button(
+        "🎲 Simulate Career Decisions",
+        type="primary",
+        use_container_width=True,
+        key="readiness_to_simulator",
+        on_click=go_to_page,
+        args=("What-If Simulator",),
+    )
+    c2.button(
+        "🗺️ Generate Learning Roadmap",
+        type="secondary",
+        use_container_width=True,
+        key="readiness_to_roadmap",
+        on_click=go_to_page,
+        args=("Roadmap",),
+    )
 
 
 def render_simulator(simulator):
     baseline = st.session_state.baseline
     if not baseline:
         st.warning("⚠️ Complete readiness analysis first to unlock simulations.")
-        if st.button("Go to Readiness & Gaps", type="primary", use_container_width=True):
-            st.session_state.page = "Readiness & Gaps"
-            st.rerun()
+        st.button(
+            "Go to Readiness & Gaps",
+            type="primary",
+            use_container_width=True,
+            on_click=go_to_page,
+            args=("Readiness & Gaps",),
+        )
         return
 
     career = st.session_state.selected_career
@@ -770,6 +1063,59 @@ def render_simulator(simulator):
     cols[2].metric("Risk", baseline["risk_level"])
     cols[3].metric("Gap", f"{baseline['gap_analysis']['gap_percentage']:.1f}%")
 
+    render_simulation_controls(simulator, baseline, career)
+
+    if st.session_state.simulations:
+        st.markdown("---")
+        st.markdown("**Simulation comparison**")
+        comparison = simulator.compare_simulations(st.session_state.simulations)
+        table = build_comparison_table(comparison)
+        st.dataframe(
+            table,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "rank": st.column_config.NumberColumn("Rank", format="%d"),
+                "simulation_type": "Simulation",
+                "readiness_score": st.column_config.ProgressColumn("Readiness", format="%.1f", min_value=0, max_value=100),
+                "score_change": st.column_config.NumberColumn("Score Δ", format="%+.1f"),
+                "time_weeks": st.column_config.NumberColumn("Weeks", format="%.1f"),
+                "time_change": st.column_config.NumberColumn("Weeks Δ", format="%+.1f"),
+                "risk_level": "Risk",
+                "gap_percentage": st.column_config.NumberColumn("Gap", format="%.1f%%"),
+                "recommendation": "Recommendation",
+            },
+            column_order=(
+                "rank",
+                "simulation_type",
+                "readiness_score",
+                "score_change",
+                "time_weeks",
+                "time_change",
+                "risk_level",
+                "gap_percentage",
+                "recommendation",
+            ),
+        )
+        st.bar_chart(
+            table,
+            x="simulation_type",
+            y="readiness_score",
+            color="risk_level",
+            stack=False,
+            x_label="Simulation",
+            y_label="Readiness score",
+            height=320,
+        )
+        if st.button("🔄 Clear All Simulations", use_container_width=True, key="clear_sims"):
+            st.session_state.simulations = []
+            st.rerun()
+
+
+# Widget changes only rerun this fragment; a new simulation reruns the app so
+# the comparison table and chart pick it up.
+@st.fragment
+def render_simulation_controls(simulator, baseline, career):
     sim_type = st.radio(
         "Choose a decision to test",
         [
@@ -783,19 +1129,18 @@ def render_simulator(simulator):
 
     result = None
     if sim_type == "Switch career":
-        choices = [m for m in st.session_state.career_matches if m["role_id"] != career["role_id"]]
-        target = st.selectbox("🔄 New Career", [c["role_name"] for c in choices])
+        choices = {m["role_name"]: m for m in st.session_state.career_matches if m["role_id"] != career["role_id"]}
+        target = st.selectbox("🔄 New Career", list(choices))
         if st.button("🎲 Simulate Career Switch", type="primary", use_container_width=True):
-            chosen = next(c for c in choices if c["role_name"] == target)
-            result = simulator.simulate_switch_career(baseline, chosen)
+            result = simulator.simulate_switch_career(baseline, choices[target])
     elif sim_type == "Skip certifications":
-        certs = [s for s in baseline["gap_analysis"]["missing_skills"] if any(k in s for k in ["AWS", "Azure", "GCP", "Certified", "Certificate"])]
+        certs = [s for s in baseline["gap_analysis"]["missing_skills"] if CERTIFICATION_PATTERN.search(s)]
         selected = st.multiselect("📜 Certifications to Skip", certs, default=certs)
         if st.button("⏭️ Simulate Skip", type="primary", use_container_width=True):
             result = simulator.simulate_skip_certifications(baseline, selected)
     elif sim_type == "Project-first learning":
         partial = baseline["gap_analysis"]["partial_skills"]
-        chosen = st.multiselect("💻 Skills to Master via Projects", partial, default=partial[:3] if partial else [])
+        chosen = st.multiselect("💻 Skills to Master via Projects", partial, default=partial[:3])
         if st.button("🚀 Simulate Project Path", type="primary", use_container_width=True):
             result = simulator.simulate_focus_projects(baseline, chosen)
     elif sim_type == "Pause learning":
@@ -804,12 +1149,16 @@ def render_simulator(simulator):
             result = simulator.simulate_pause_learning(baseline, weeks)
     elif sim_type == "Add new skills":
         missing = baseline["gap_analysis"]["missing_skills"]
-        chosen = st.multiselect("➕ Skills to Add", missing, default=missing[:3] if missing else [])
+        chosen = st.multiselect("➕ Skills to Add", missing, default=missing[:3])
         if st.button("➕ Simulate New Skills", type="primary", use_container_width=True):
             result = simulator.simulate_add_skills(baseline, chosen, career)
 
     if result:
         st.session_state.simulations.append(result)
+        st.rerun()
+
+    if st.session_state.simulations:
+        result = st.session_state.simulations[-1]
         st.markdown("---")
         c1, c2 = st.columns(2)
         c1.metric("After score", result["readiness_score"]["overall_score"], f"Δ {result['changes']['score_change']:+.1f}")
@@ -823,28 +1172,22 @@ def render_simulator(simulator):
             st.warning(result["warning"])
         if result.get("benefit"):
             st.success(result["benefit"])
-        with st.expander("Detailed changes"):
+        # The full changes tree is only sent when asked for
+        if st.toggle(f"Show detailed changes ({len(result['changes'])} fields)", key="show_sim_changes"):
             st.json(result["changes"])
 
-    if st.session_state.simulations:
-        st.markdown("---")
-        st.markdown("**Simulation comparison**")
-        df = pd.DataFrame(simulator.compare_simulations(st.session_state.simulations))
-        st.dataframe(df, use_container_width=True, hide_index=True)
-        fig = px.bar(df, x="simulation_type", y="readiness_score", color="risk_level")
-        st.plotly_chart(fig, use_container_width=True)
-        if st.button("🔄 Clear All Simulations", use_container_width=True, key="clear_sims"):
-            st.session_state.simulations = []
-            st.rerun()
 
-
-def render_roadmap(resources_df, skills_df):
+def render_roadmap(resource_index, skills_df, data_version):
     baseline = st.session_state.baseline
     if not baseline:
         st.warning("⚠️ Generate readiness analysis first.")
-        if st.button("Go to Readiness & Gaps", type="primary", use_container_width=True):
-            st.session_state.page = "Readiness & Gaps"
-            st.rerun()
+        st.button(
+            "Go to Readiness & Gaps",
+            type="primary",
+            use_container_width=True,
+            on_click=go_to_page,
+            args=("Readiness & Gaps",),
+        )
         return
 
     gap = baseline["gap_analysis"]
@@ -854,54 +1197,50 @@ def render_roadmap(resources_df, skills_df):
     cols[1].metric("Skills to learn", gap["missing_skills_count"])
     cols[2].metric("Skills to improve", gap["partial_skills_count"])
 
-    plan = create_weekly_plan(gap["missing_skills"], gap["partial_skills"], skills_df)
-    for phase in plan:
-        with st.expander(f"Phase {phase['phase']} · {phase['duration_weeks']} weeks", expanded=phase["phase"] == 1):
-            for task in phase["skills"]:
-                st.write(f"**{task['type']}** {task['skill']} · {task['difficulty']}")
-                resources = get_skill_resources(task["skill"], resources_df)
-                if resources:
-                    st.caption("Top resources:")
-                    for res in resources[:2]:
-                        st.markdown(f"- [{res['name']}]({res['url']}) · {res['type']} · {res['duration']} weeks")
+    plan, phases = build_roadmap_view(
+        tuple(gap["missing_skills"]), tuple(gap["partial_skills"]), data_version, skills_df, resource_index
+    )
+    for phase in phases:
+        with st.expander(phase["title"], expanded=phase["expanded"]):
+            st.markdown(phase["body_md"])
 
     st.download_button(
         "Download roadmap (JSON)",
-        data=json.dumps(
+        data=encode_roadmap_json(
             {
                 "career": baseline["career"],
                 "readiness_score": baseline["readiness_score"]["overall_score"],
                 "estimated_weeks": gap["estimated_learning_time_weeks"],
                 "phases": plan,
                 "priority_skills": gap["priority_skills"],
-            },
-            indent=2,
+            }
         ),
         file_name=f"career_roadmap_{baseline['career'].replace(' ', '_')}.json",
         mime="application/json",
     )
 
 
-def render_daily_plan(resources_df, daily_learning):
+def render_daily_plan(resource_index, data_version, skill_gap_analyzer, daily_learning):
     if not st.session_state.selected_career:
         st.warning("⚠️ Select a career and complete readiness analysis first.")
-        if st.button("Go to Readiness & Gaps", type="primary", use_container_width=True):
-            st.session_state.page = "Readiness & Gaps"
-            st.rerun()
+        st.button(
+            "Go to Readiness & Gaps",
+            type="primary",
+            use_container_width=True,
+            on_click=go_to_page,
+            args=("Readiness & Gaps",),
+        )
         return
 
-    gap = SkillGapAnalyzer(skills_df).analyze_gap(
-        st.session_state.user_profile["skills"], st.session_state.selected_career
+    career = st.session_state.selected_career
+    skills_key = tuple(sorted(st.session_state.user_profile["skills"]))
+    gap = cached_gap_analysis(skill_gap_analyzer, data_version, skills_key, career["role_id"], career)
+    skill_gaps = build_daily_skill_gaps(
+        tuple(gap["missing_skills"]),
+        tuple(skill.get("skill", "") if isinstance(skill, dict) else skill for skill in gap["partial_skills"]),
+        data_version,
+        resource_index,
     )
-    skill_gaps = []
-    for skill in gap["missing_skills"]:
-        skill_gaps.append({"skill": skill, "priority": 100, "hours_needed": 20, "resources": get_skill_resources(skill, resources_df)})
-    for skill in gap["partial_skills"]:
-        if isinstance(skill, dict):
-            skill_name = skill.get("skill", "")
-        else:
-            skill_name = skill
-        skill_gaps.append({"skill": skill_name, "priority": 60, "hours_needed": 10, "resources": get_skill_resources(skill_name, resources_df)})
 
     user_progress = st.session_state.get("learning_progress", {})
     for g in skill_gaps:
@@ -915,44 +1254,69 @@ def render_daily_plan(resources_df, daily_learning):
         st.session_state.daily_plan = daily_learning.generate_daily_plan(skill_gaps, user_progress, pace, hours)
 
     if st.session_state.daily_plan:
+        render_daily_tasks(daily_learning, skill_gaps, user_progress, hours)
+
+
+# Saving progress only reruns the task list and its summary; the gap
+# analysis, sidebar and pace controls above are left as they are.
+@st.fragment
+def render_daily_tasks(daily_learning, skill_gaps, user_progress, hours):
+    # One form for every task: slider drags never rerun, and Save all
+    # collects the changed skills in a single pass
+    with st.form("daily_progress", border=False):
+        changed = {}
         for idx, task in enumerate(st.session_state.daily_plan):
             with st.expander(f"📌 Task {idx+1}: {task['activity']} ({task['skill']})", expanded=idx == 0):
-                st.write(f"⏱️ **Duration:** {task['duration']}")
-                st.write(f"🎯 **Milestone:** {task['milestone']}")
+                body = f"⏱️ **Duration:** {task['duration']}\n\n🎯 **Milestone:** {task['milestone']}"
                 if task["resources"]:
-                    st.caption("📚 Resources")
-                    for res in task["resources"]:
-                        title = res.get("title") or res.get("name") or "Resource"
-                        url = res.get("url", "")
-                        st.markdown(f"- [{title}]({url})")
+                    body += "\n\n:gray[📚 Resources]\n\n" + "\n".join(
+                        f"- [{res.get('title') or res.get('name') or 'Resource'}]({res.get('url', '')})"
+                        for res in task["resources"]
+                    )
+                st.markdown(body)
                 current = user_progress.get(task["skill"], 0)
-                new = st.slider("📊 Progress", 0, 100, current, key=f"progress_{idx}")
-                if st.button("💾 Save Progress", key=f"save_{idx}", type="primary", use_container_width=True):
-                    user_progress[task["skill"]] = new
-                    st.session_state.learning_progress = user_progress
-                    user_auth.update_learning_progress(st.session_state.user_email, task["skill"], new)
-                    st.success("✅ Progress saved!")
-
-        summary = daily_learning.get_progress_summary(user_progress, skill_gaps)
-        st.markdown("---")
-        cols = st.columns(4)
-        cols[0].metric("Total skills", summary["total_skills"])
-        cols[1].metric("Completed", summary["completed_skills"])
-        cols[2].metric("In progress", summary["in_progress_skills"])
-        cols[3].metric("Avg progress", f"{summary['average_progress']}%")
-        eta = daily_learning.calculate_estimated_completion(skill_gaps, hours)
-        st.caption(f"Estimated completion: {eta['completion_date']} · ~{eta['weeks_needed']} weeks")
+                value = st.slider("📊 Progress", 0, 100, current, key=f"progress_{idx}")
+                if value != current:
+                    changed[task["skill"]] = value
+        saved = st.form_submit_button("💾 Save all progress", type="primary", use_container_width=True)
+
+    if saved and not changed:
+        st.info("No changes to save.")
+    elif saved:
+        user_progress.update(changed)
+        st.session_state.learning_progress = user_progress
+        # One bulk write on the background writer; a failure is reported on the next run
+        submit_user_write(get_user_auth().update_learning_progress_bulk, st.session_state.user_email, changed)
+        st.success(f"✅ Progress saved for {len(changed)} skill(s)!")
+
+    summary = daily_learning.get_progress_summary(user_progress, skill_gaps)
+    st.markdown("---")
+    render_metric_cards(
+        (
+            ("Total skills", summary["total_skills"]),
+            ("Completed", summary["completed_skills"]),
+            ("In progress", summary["in_progress_skills"]),
+            ("Avg progress", f"{summary['average_progress']}%"),
+        )
+    )
+    eta = daily_learning.calculate_estimated_completion(skill_gaps, hours)
+    st.caption(f"Estimated completion: {eta['completion_date']} · ~{eta['weeks_needed']} weeks")
 
 
 def render_jobs_and_outreach(job_search, email_templates):
     if not st.session_state.selected_career:
         st.warning("⚠️ Select a career first.")
-        if st.button("Go to Career Mentor", type="primary", use_container_width=True):
-            st.session_state.page = "Career Mentor"
-            st.rerun()
+        st.button(
+            "Go to Career Mentor",
+            type="primary",
+            use_container_width=True,
+            on_click=go_to_page,
+            args=("Career Mentor",),
+        )
         return
 
     career = st.session_state.selected_career["role_name"]
+    skills = st.session_state.user_profile.get("skills", []) if st.session_state.user_profile else []
     st.markdown(f"<div class='section-title'>💼 Job Discovery & Outreach: {career}</div>", unsafe_allow_html=True)
     col1, col2, col3 = st.columns(3)
     location = col1.selectbox("📍 Location", ["Remote", "Hybrid", "On-site", "Any"], index=0)
@@ -961,12 +1325,17 @@ def render_jobs_and_outreach(job_search, email_templates):
 
     if st.button("🔍 Search Jobs", type="primary", use_container_width=True):
         with st.spinner("Scanning job boards..."):
-            st.session_state.job_results = job_search.get_recommended_jobs(
-                career, st.session_state.user_profile.get("skills", []), location, top_n
-            )
+            jobs = job_search.get_recommended_jobs(career, skills, location, top_n)
+            # Tips only depend on the job and the searched skills, so they are
+            # built once here rather than for every listed job on each rerun
+            for job in jobs:
+                job["tips"] = job_search.get_job_application_tips(job, skills)
+            st.session_state.job_results = jobs
+            st.session_state.jobs_shown = JOBS_PAGE_SIZE
 
     if st.session_state.job_results:
-        for idx, job in enumerate(st.session_state.job_results):
+        jobs = st.session_state.job_results
+        for idx, job in enumerate(jobs[: st.session_state.jobs_shown]):
             with st.expander(f"{job['title']} · {job['company']} ({job['match_score']}% match)"):
                 st.write(job["description"])
                 st.caption(f"Location: {job['location']} | Type: {job['type']} | Posted: {job['posted_date']}")
@@ -974,15 +1343,28 @@ def render_jobs_and_outreach(job_search, email_templates):
                     st.write("Requirements:")
                     st.write(", ".join(job["requirements"]))
                 st.metric("Match score", f"{job['match_score']}%")
-                tips = job_search.get_job_application_tips(job, st.session_state.user_profile.get("skills", []))
                 st.write("Tips:")
-                for t in tips:
+                for t in job["tips"]:
                     st.write(f"- {t}")
                 if st.button("✉️ Generate Application Email", key=f"email_{idx}", type="primary", use_container_width=True):
                     st.session_state.selected_job_for_email = job
                     st.session_state.page = "Jobs & Outreach"
+        if len(jobs) > st.session_state.jobs_shown:
+            st.button(
+                f"Show more ({len(jobs) - st.session_state.jobs_shown} remaining)",
+                key="jobs_show_more",
+                on_click=show_more_jobs,
+                use_container_width=True,
+            )
 
     st.markdown("---")
+    render_email_templates(email_templates, skills)
+
+
+# Typing into the template inputs only reruns this block, not the job search
+# and listing above it.
+@st.fragment
+def render_email_templates(email_templates, skills):
     st.subheader("Email templates")
     template_type = st.selectbox(
         "Template",
@@ -990,7 +1372,6 @@ def render_jobs_and_outreach(job_search, email_templates):
     )
 
     user_name = st.session_state.user_data.get("name", "Your Name")
-    skills = st.session_state.user_profile.get("skills", [])
 
     if template_type == "Job application":
         job = st.session_state.selected_job_for_email
@@ -1028,6 +1409,18 @@ def render_jobs_and_outreach(job_search, email_templates):
             st.text_area("Draft", email, height=320)
 
 
+def render_metric_cards(items):
+    cards = "".join(
+        f"<div class='metric-card'><div class='metric-value'>{value}</div><div class='metric-label'>{label}</div></div>"
+        for label, value in items
+    )
+    st.markdown(f"<div class='metric-grid'>{cards}</div>", unsafe_allow_html=True)
+
+
+def show_more_jobs():
+    st.session_state.jobs_shown += JOBS_PAGE_SIZE
+
+
 def render_settings():
     st.markdown("<div class='section-title'>⚙️ Settings</div>", unsafe_allow_html=True)
     notif = st.checkbox("🔔 Enable daily email notifications", value=True)
@@ -1036,7 +1429,7 @@ def render_settings():
 
     if st.button("💾 Save Notification Preferences", type="primary", use_container_width=True):
         preferences = {"email_notifications": notif, "notification_time": "09:00"}
-        success, msg = user_auth.update_notification_preferences(st.session_state.user_email, preferences)
+        success, msg = get_user_auth().update_notification_preferences(st.session_state.user_email, preferences)
         if success:
             st.success("✅ Preferences saved")
         else:
@@ -1049,6 +1442,7 @@ def render_settings():
     st.write(f"📅 **Created:** {st.session_state.user_data.get('created_at', 'N/A')}")
 
     if sender_email and sender_password and st.button("📧 Send Test Email", type="primary", use_container_width=True):
+        email_service = get_email_service()
         email_service.configure(sender_email, sender_password)
         results_html = email_service.format_results(78, 4, 3)
         plan_html = email_service.format_learning_plan(
@@ -1071,51 +1465,40 @@ def render_settings():
 
 # App bootstrap
 ensure_session_defaults()
+report_user_write_failures()
+
+# Auth gate: render_auth() ends with st.stop(), so the login screen never
+# touches the datasets, the sidebar or any page renderer
+if not st.session_state.logged_in:
+    render_auth()
 
 try:
-    careers_df, skills_df, resources_df = load_app_data()
+    data_version = get_data_version()
+    careers_df, skills_df, resources_df = load_app_data(data_version)
 except Exception as exc:  # graceful data load failure
     st.error(f"Error loading data: {exc}")
     st.stop()
 
-(
-    skill_extractor,
-    career_matcher,
-    skill_gap_analyzer,
-    readiness_calculator,
-    simulator,
-    user_auth,
-    email_service,
-    job_search,
-    email_templates,
-    daily_learning,
-) = init_services(careers_df, skills_df)
-
-# Auth gate
-if not st.session_state.logged_in:
-    render_auth()
-
 # Sidebar + page routing
 nav_choice = sidebar_nav()
 
-if nav_choice == "Overview":
-    render_overview(careers_df, skills_df, resources_df)
-elif nav_choice == "Profile":
-    render_profile(skill_extractor)
-elif nav_choice == "Career Mentor":
-    render_career_mentor(career_matcher)
-elif nav_choice == "Readiness & Gaps":
-    render_readiness(skill_gap_analyzer, readiness_calculator, simulator)
-elif nav_choice == "What-If Simulator":
-    render_simulator(simulator)
-elif nav_choice == "Roadmap":
-    render_roadmap(resources_df, skills_df)
-elif nav_choice == "Daily Plan":
-    render_daily_plan(resources_df, daily_learning)
-elif nav_choice == "Jobs & Outreach":
-    render_jobs_and_outreach(job_search, email_templates)
-elif nav_choice == "Settings":
-    render_settings()
-
-st.markdown("---")
-st.caption("Career GPS™ — Adaptive career guidance, skill-gap navigation, and readiness simulation.")
\ No newline at end of file
+# One-shot messages queued before a st.rerun() are shown on the next run only
+if st.session_state.flash_message:
+    st.toast(st.session_state.flash_message, icon="👋")
+    st.session_state.flash_message = None
+
+PAGE_RENDERERS = {
+    "Overview": lambda: render_overview(careers_df, skills_df, resources_df),
+    "Profile": lambda: render_profile(get_skill_extractor(data_version, skills_df), data_version),
+    "Career Mentor": lambda: render_career_mentor(get_career_matcher(data_version, careers_df), data_version),
+    "Readiness & Gaps": lambda: render_readiness(get_skill_gap_analyzer(data_version, skills_df), get_readiness_calculator(), get_simulator(data_version, skills_df), data_version),
+    "What-If Simulator": lambda: render_simulator(get_simulator(data_version, skills_df)),
+    "Roadmap": lambda: render_roadmap(get_resource_index(data_version, resources_df), skills_df, data_version),
+    "Daily Plan": lambda: render_daily_plan(get_resource_index(data_version, resources_df), data_version, get_skill_gap_analyzer(data_version, skills_df), get_daily_learning()),
+    "Jobs & Outreach": lambda: render_jobs_and_outreach(get_job_search(data_version, careers_df), get_email_templates()),
+    "Settings": render_settings,
+}
+PAGE_RENDERERS[nav_choice]()
+
+# Divider and tagline go out as one element
+st.caption("---\n\nCareer GPS™ — Adaptive career guidance, skill-gap navigation, and readiness simulation.")
\ No newline at end of file
@@ -14,6 +14,7 @@ class CareerMatcher:
         self.careers_df = careers_df
         self.embedder = SkillEmbedder()
         self._prepare_career_embeddings()
+        self._prepare_career_records()
     
     def _prepare_career_embeddings(self):
         """Prepare career descriptions for matching"""
@@ -27,6 +28,17 @@ class CareerMatcher:
         self.career_embeddings = self.embedder.fit_transform(career_texts)
         self.career_texts = career_texts
     
+    def _prepare_career_records(self):
+        """Convert careers to plain dicts with parsed skill lists, reused by every match"""
+        self.career_records = [
+            dict(
+                record,
+                required_skills=parse_skills_list(record['required_skills']),
+                importance_weights=parse_importance_weights(record['importance_weights'])
+            )
+            for record in self.careers_df.to_dict('records')
+        ]
+    
     def match_careers(self, user_skills, user_interests=None, top_n=5):
         """
         Match user with top N careers
@@ -45,8 +57,8 @@ class CareerMatcher:
         
         matches = []
         for idx in top_indices:
-            career = self.careers_df.iloc[idx]
-            required_skills = parse_skills_list(career['required_skills'])
+            career = self.career_records[idx]
+            required_skills = list(career['required_skills'])
             
             # Calculate skill overlap
             matched, partial, missing, overlap_score = compute_skill_overlap(
@@ -61,14 +73,14 @@ class CareerMatcher:
                 'role_name': career['role_name'],
                 'category': career['category'],
                 'description': career['description'],
-                'match_score': final_score * 100,
-                'similarity_score': similarities[idx] * 100,
+                'match_score': float(final_score * 100),
+                'similarity_score': float(similarities[idx] * 100),
                 'skill_overlap_score': overlap_score * 100,
                 'required_skills': required_skills,
                 'matched_skills': matched,
                 'partial_skills': partial,
                 'missing_skills': missing,
-                'importance_weights': parse_importance_weights(career['importance_weights']),
+                'importance_weights': list(career['importance_weights']),
                 'avg_salary': career['avg_salary'],
                 'growth_rate': career['growth_rate']
             })
@@ -249,6 +249,10 @@ class DailyLearningPlan:
         if total_days_learning >= 100:
             badges.append("🏆 Centurion - 100 days streak")
         
+        # No progress recorded yet: no mastery or progress badges can apply
+        if not any(user_progress.values()):
+            return badges
+        
         # Skill mastery badges
         mastered_skills = sum(1 for progress in user_progress.values() if progress >= 80)
         if mastered_skills >= 1:
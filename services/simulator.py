@@ -18,17 +18,21 @@ class CareerSimulator:
         self.gap_analyzer = SkillGapAnalyzer(skills_df)
         self.score_calculator = ReadinessScoreCalculator()
     
-    def create_baseline(self, user_skills, career_match):
+    def create_baseline(self, user_skills, career_match, gap_analysis=None, readiness_score=None):
         """
         Create baseline state for simulation
-        Returns initial state with all metrics
+        Returns initial state with all metrics; an already computed gap
+        analysis and readiness score for the same inputs are reused
         """
-        gap_analysis = self.gap_analyzer.analyze_gap(user_skills, career_match)
-        readiness_score = self.score_calculator.calculate_score(gap_analysis)
+        if gap_analysis is None:
+            gap_analysis = self.gap_analyzer.analyze_gap(user_skills, career_match)
+        if readiness_score is None:
+            readiness_score = self.score_calculator.calculate_score(gap_analysis)
         
         baseline = {
             'user_skills': user_skills.copy(),
             'career': career_match['role_name'],
+            'role_id': career_match.get('role_id'),
             'gap_analysis': gap_analysis,
             'readiness_score': readiness_score,
             'learning_time_weeks': gap_analysis['estimated_learning_time_weeks'],
@@ -285,34 +289,33 @@ class CareerSimulator:
     def compare_simulations(self, simulations):
         """
         Compare multiple simulation results
-        Returns ranked comparison with recommendations
+        Returns ranked comparison as column lists (one entry per simulation)
         """
-        comparison = []
-        
-        for sim in simulations:
-            comparison.append({
-                'simulation_type': sim['simulation_type'],
-                'readiness_score': sim['readiness_score']['overall_score'],
-                'score_change': sim['changes']['score_change'],
-                'time_weeks': sim['learning_time_weeks'],
-                'time_change': sim['changes']['time_change'],
-                'risk_level': sim['risk_level'],
-                'gap_percentage': sim['gap_analysis']['gap_percentage']
-            })
-        
-        # Rank by readiness score
-        comparison.sort(key=lambda x: x['readiness_score'], reverse=True)
+        ranked = sorted(simulations, key=lambda sim: sim['readiness_score']['overall_score'], reverse=True)
+        
+        score_changes = [sim['changes']['score_change'] for sim in ranked]
+        time_changes = [sim['changes']['time_change'] for sim in ranked]
         
         # Add recommendations
-        for i, comp in enumerate(comparison):
-            comp['rank'] = i + 1
+        recommendations = []
+        for i, (score_change, time_change) in enumerate(zip(score_changes, time_changes)):
             if i == 0:
-                comp['recommendation'] = 'Best Overall Outcome'
-            elif comp['time_change'] < 0:
-                comp['recommendation'] = 'Fastest Path'
-            elif comp['score_change'] > 5:
-                comp['recommendation'] = 'Highest Score Gain'
+                recommendations.append('Best Overall Outcome')
+            elif time_change < 0:
+                recommendations.append('Fastest Path')
+            elif score_change > 5:
+                recommendations.append('Highest Score Gain')
             else:
-                comp['recommendation'] = 'Consider Trade-offs'
-        
-        return comparison
+                recommendations.append('Consider Trade-offs')
+        
+        return {
+            'simulation_type': [sim['simulation_type'] for sim in ranked],
+            'readiness_score': [sim['readiness_score']['overall_score'] for sim in ranked],
+            'score_change': score_changes,
+            'time_weeks': [sim['learning_time_weeks'] for sim in ranked],
+            'time_change': time_changes,
+            'risk_level': [sim['risk_level'] for sim in ranked],
+            'gap_percentage': [sim['gap_analysis']['gap_percentage'] for sim in ranked],
+            'rank': list(range(1, len(ranked) + 1)),
+            'recommendation': recommendations
+        }
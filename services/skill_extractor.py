@@ -12,6 +12,11 @@ class SkillExtractor:
     def __init__(self, skills_df):
         self.skills_df = skills_df
         self.known_skills = skills_df['skill_name'].tolist()
+        # One precompiled pattern per skill covering base, plural and -ing forms
+        self._skill_patterns = [
+            (skill, re.compile(rf'\b{re.escape(skill.lower())}(?:s|ing)?\b'))
+            for skill in self.known_skills
+        ]
     
     def extract_from_text(self, text):
         """
@@ -34,25 +39,9 @@ class SkillExtractor:
     
     def _pattern_based_extraction(self, text):
         """Extract skills using pattern matching"""
-        extracted = []
         text_lower = text.lower()
         
-        for skill in self.known_skills:
-            skill_lower = skill.lower()
-            
-            # Check for variations
-            patterns = [
-                rf'\b{re.escape(skill_lower)}\b',
-                rf'\b{re.escape(skill_lower)}s\b',  # Plural
-                rf'\b{re.escape(skill_lower)}ing\b',  # -ing form
-            ]
-            
-            for pattern in patterns:
-                if re.search(pattern, text_lower):
-                    extracted.append(skill)
-                    break
-        
-        return extracted
+        return [skill for skill, pattern in self._skill_patterns if pattern.search(text_lower)]
     
     def extract_from_list(self, skills_list):
         """
@@ -2,15 +2,32 @@
 User Authentication Service
 Handles user registration, login, and session management
 """
+import copy
 import json
 import hashlib
 import os
+import tempfile
+import threading
 from datetime import datetime
+from functools import wraps
 from pathlib import Path
 
+
+def _synchronized(method):
+    """Run a method that loads or saves users under the instance lock"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class UserAuth:
     def __init__(self, users_file='data/users.json'):
         self.users_file = users_file
+        self._users_cache = None
+        self._users_stamp = None
+        self._lock = threading.RLock()
         self._ensure_users_file()
     
     def _ensure_users_file(self):
@@ -24,25 +41,53 @@ class UserAuth:
         """Hash password using SHA-256"""
         return hashlib.sha256(password.encode()).hexdigest()
     
+    def _file_stamp(self):
+        """(mtime_ns, size) of the users file, or None if it is missing"""
+        try:
+            stat = os.stat(self.users_file)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
     def _load_users(self):
-        """Load users from JSON file"""
+        """Load users from JSON file, reusing the parsed copy while the file is unchanged"""
+        stamp = self._file_stamp()
+        if self._users_cache is not None and stamp == self._users_stamp:
+            return self._users_cache
         try:
             with open(self.users_file, 'r') as f:
-                return json.load(f)
+                users = json.load(f)
         except:
             return {}
+        self._users_cache = users
+        self._users_stamp = stamp
+        return users
+    
+    def _load_users_for_update(self):
+        """Deep copy of the users for a write; the cache only changes once it is saved"""
+        return copy.deepcopy(self._load_users())
     
     def _save_users(self, users):
-        """Save users to JSON file"""
-        with open(self.users_file, 'w') as f:
-            json.dump(users, f, indent=2)
+        """Save users to JSON file, swapping in a fully written temp file so readers never see a partial one"""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.users_file)), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(users, f, indent=2)
+            os.replace(tmp_path, self.users_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._users_cache = users
+        self._users_stamp = self._file_stamp()
     
+    @_synchronized
     def register_user(self, email, password, name, user_type='student'):
         """
         Register a new user
         Returns: (success: bool, message: str)
         """
-        users = self._load_users()
+        users = self._load_users_for_update()
         
         # Check if user already exists
         if email in users:
@@ -66,6 +111,7 @@ class UserAuth:
         self._save_users(users)
         return True, "Registration successful"
     
+    @_synchronized
     def login_user(self, email, password):
         """
         Authenticate user
@@ -80,20 +126,21 @@ class UserAuth:
             return False, None, "Incorrect password"
         
         # Return user data without password
-        user_data = users[email].copy()
+        user_data = copy.deepcopy(users[email])
         user_data.pop('password')
         user_data['email'] = email
         
         return True, user_data, "Login successful"
     
+    @_synchronized
     def update_user_profile(self, email, profile_data):
         """Update user's career profile"""
-        users = self._load_users()
+        users = self._load_users_for_update()
         
         if email not in users:
             return False, "User not found"
         
-        users[email]['profile'] = profile_data
+        users[email]['profile'] = copy.deepcopy(profile_data)
         users[email]['profile']['updated_at'] = datetime.now().isoformat()
         
         self._save_users(users)
@@ -101,7 +148,12 @@ class UserAuth:
     
     def update_learning_progress(self, email, skill, progress):
         """Update user's learning progress for a skill"""
-        users = self._load_users()
+        return self.update_learning_progress_bulk(email, {skill: progress})
+    
+    @_synchronized
+    def update_learning_progress_bulk(self, email, progress_by_skill):
+        """Update learning progress for several skills with a single file write"""
+        users = self._load_users_for_update()
         
         if email not in users:
             return False, "User not found"
@@ -109,17 +161,20 @@ class UserAuth:
         if 'learning_progress' not in users[email]:
             users[email]['learning_progress'] = {}
         
-        users[email]['learning_progress'][skill] = {
-            'progress': progress,
-            'updated_at': datetime.now().isoformat()
-        }
+        updated_at = datetime.now().isoformat()
+        for skill, progress in progress_by_skill.items():
+            users[email]['learning_progress'][skill] = {
+                'progress': progress,
+                'updated_at': updated_at
+            }
         
         self._save_users(users)
         return True, "Progress updated"
     
+    @_synchronized
     def add_career_history(self, email, career_data):
         """Add a career decision to user's history"""
-        users = self._load_users()
+        users = self._load_users_for_update()
         
         if email not in users:
             return False, "User not found"
@@ -133,6 +188,7 @@ class UserAuth:
         self._save_users(users)
         return True, "Career history updated"
     
+    @_synchronized
     def get_user_data(self, email):
         """Get full user data"""
         users = self._load_users()
@@ -140,15 +196,16 @@ class UserAuth:
         if email not in users:
             return None
         
-        user_data = users[email].copy()
+        user_data = copy.deepcopy(users[email])
         user_data.pop('password', None)
         user_data['email'] = email
         
         return user_data
     
+    @_synchronized
     def update_notification_preferences(self, email, preferences):
         """Update user's notification preferences"""
-        users = self._load_users()
+        users = self._load_users_for_update()
         
         if email not in users:
             return False, "User not found"
@@ -1,21 +1,29 @@
 """
 Helper utility functions
 """
+import os
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 
+DATA_FILES = ('data/careers.csv', 'data/skills.csv', 'data/resources.csv')
+
+
 def load_data():
     """Load all CSV datasets"""
     try:
-        careers_df = pd.read_csv('data/careers.csv')
-        skills_df = pd.read_csv('data/skills.csv')
-        resources_df = pd.read_csv('data/resources.csv')
+        careers_df, skills_df, resources_df = (pd.read_csv(path) for path in DATA_FILES)
         return careers_df, skills_df, resources_df
     except FileNotFoundError as e:
         raise Exception(f"Data file not found: {e}. Please ensure CSV files are in the 'data' folder.")
 
 
+def get_data_version():
+    """Return modification times of the CSV datasets (used as a cache key)"""
+    return tuple(os.path.getmtime(path) if os.path.exists(path) else None for path in DATA_FILES)
+
+
 def parse_skills_list(skills_string):
     """Parse comma-separated skills string into list"""
     if pd.isna(skills_string) or not skills_string:
@@ -121,6 +129,21 @@ def get_skill_resources(skill_name, resources_df):
     return resource_list
 
 
+def build_resource_index(resources_df):
+    """Group learning resources by lower-cased skill name for O(1) lookups"""
+    index = {}
+    for row in resources_df.to_dict('records'):
+        index.setdefault(str(row['skill_name']).lower(), []).append({
+            'name': row['resource_name'],
+            'type': row['resource_type'],
+            'url': row['url'],
+            'duration': row['duration_weeks'],
+            'difficulty': row['difficulty']
+        })
+    return index
+
+
+@lru_cache(maxsize=256)
 def format_timeline_estimate(weeks):
     """Format weeks into readable timeline"""
     if weeks <= 4: